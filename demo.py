@@ -11,16 +11,42 @@
 
 import asyncio
 import contextlib
-import json
 from decimal import Decimal
 
+try:
+    # Optional faster event loop: pip install nalogo[fast]
+    import uvloop
+except ImportError:
+    uvloop = None
+
+from pydantic import ValidationError
+
 from nalogo import Client
 from nalogo.dto.income import (
     IncomeClient,
+    IncomeRequest,
     IncomeServiceItem,
     IncomeType,
+    total_amount,
+)
+
+# Неизменные данные чека создаются один раз при импорте, а не для каждого чека.
+# Для заведомо корректных данных валидацию можно пропустить (model_construct)
+DEMO_SERVICES = [
+    IncomeServiceItem.model_construct(
+        name="Разработка сайта", amount=Decimal("25000.00"), quantity=Decimal("1")
+    ),
+    IncomeServiceItem.model_construct(
+        name="Техподдержка", amount=Decimal("5000.00"), quantity=Decimal("3")
+    ),
+]
+
+DEMO_LEGAL_CLIENT = IncomeClient(
+    display_name="ООО 'Демо Компания'",
+    income_type=IncomeType.FROM_LEGAL_ENTITY,
+    inn="1234567890",
+    contact_phone="+79001234567",
 )
-from nalogo.exceptions import ValidationException
 
 
 async def demo_authentication():
@@ -39,7 +65,7 @@ async def demo_authentication():
         },
     }
 
-    await client.authenticate(json.dumps(fake_token))
+    await client.authenticate_dict(fake_token)
 
     return client
 
@@ -50,7 +76,7 @@ async def demo_income_creation(client: Client):
     _ = client
 
     # Вместо реальных HTTP запросов покажем структуру данных
-    with contextlib.suppress(ValidationException):
+    with contextlib.suppress(ValidationError):
         # Создаем объекты для демонстрации валидации
         IncomeServiceItem(
             name="Консультационные услуги",
@@ -58,22 +84,11 @@ async def demo_income_creation(client: Client):
             quantity=Decimal("1"),
         )
 
-    services = [
-        IncomeServiceItem(
-            name="Разработка сайта", amount=Decimal("25000.00"), quantity=Decimal("1")
-        ),
-        IncomeServiceItem(
-            name="Техподдержка", amount=Decimal("5000.00"), quantity=Decimal("3")
-        ),
-    ]
-
-    sum(item.get_total_amount() for item in services)
-
-    IncomeClient(
-        display_name="ООО 'Демо Компания'",
-        income_type=IncomeType.FROM_LEGAL_ENTITY,
-        inn="1234567890",
-        contact_phone="+79001234567",
+    # Запрос для юрлица из заранее созданных клиента и услуг
+    IncomeRequest(
+        services=DEMO_SERVICES,
+        total_amount=str(total_amount(DEMO_SERVICES)),
+        client=DEMO_LEGAL_CLIENT,
     )
 
 
@@ -94,19 +109,19 @@ async def demo_error_handling():
 
     # Валидация неверных данных
 
-    with contextlib.suppress(ValueError):
+    with contextlib.suppress(ValidationError):
         # Пустое название услуги
         IncomeServiceItem(name="", amount=Decimal("100"), quantity=Decimal("1"))
 
-    with contextlib.suppress(Exception):
+    with contextlib.suppress(ValidationError):
         # Отрицательная сумма
         IncomeServiceItem(name="Услуга", amount=Decimal("-100"), quantity=Decimal("1"))
 
-    with contextlib.suppress(Exception):
+    with contextlib.suppress(ValidationError):
         # Нулевое количество
         IncomeServiceItem(name="Услуга", amount=Decimal("100"), quantity=Decimal("0"))
 
-    with contextlib.suppress(Exception):
+    with contextlib.suppress(ValidationError):
         # Неверный ИНН
         IncomeClient(inn="123")  # Слишком короткий
 
@@ -119,7 +134,7 @@ async def demo_data_serialization():
         name="Демо услуга", amount=Decimal("1500.50"), quantity=Decimal("2")
     )
 
-    item.model_dump()
+    item.model_dump_json()
 
     # Сериализация IncomeClient
     client_data = IncomeClient(
@@ -129,7 +144,7 @@ async def demo_data_serialization():
         inn="123456789012",
     )
 
-    client_data.model_dump()
+    client_data.model_dump_json(by_alias=True)
 
 
 async def main():
@@ -138,18 +153,22 @@ async def main():
     # Демонстрация аутентификации
     client = await demo_authentication()
 
-    # Демонстрация создания чеков
-    await demo_income_creation(client)
+    # Демонстрации не зависят друг от друга и выполняются параллельно
+    async with client, asyncio.TaskGroup() as tg:
+        # Демонстрация создания чеков
+        tg.create_task(demo_income_creation(client))
 
-    # Демонстрация операций с чеками
-    await demo_receipt_operations(client)
+        # Демонстрация операций с чеками
+        tg.create_task(demo_receipt_operations(client))
 
-    # Демонстрация обработки ошибок
-    await demo_error_handling()
+        # Демонстрация обработки ошибок
+        tg.create_task(demo_error_handling())
 
-    # Демонстрация сериализации
-    await demo_data_serialization()
+        # Демонстрация сериализации
+        tg.create_task(demo_data_serialization())
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    loop_factory = uvloop.new_event_loop if uvloop else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(main())
@@ -18,13 +18,20 @@ import contextlib
 import logging
 from decimal import Decimal
 
+try:
+    # Optional faster event loop: pip install nalogo[fast]
+    import uvloop
+except ImportError:
+    uvloop = None
+
+import httpx
+from pydantic import ValidationError
+
 from nalogo import Client
 from nalogo.dto.income import IncomeClient, IncomeServiceItem, IncomeType
 from nalogo.exceptions import (
     DomainException,
-    PhoneException,
     UnauthorizedException,
-    ValidationException,
 )
 
 # Configure logging to see the library's error handling
@@ -32,15 +39,37 @@ logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 
+# Receipt data that does not change between calls is built (and validated)
+# once at import instead of on every receipt
+EXAMPLE_SERVICES = [
+    IncomeServiceItem(
+        name="Разработка веб-сайта",
+        amount=Decimal("25000.00"),
+        quantity=Decimal("1"),
+    ),
+    IncomeServiceItem(
+        name="Техническая поддержка",
+        amount=Decimal("3000.00"),
+        quantity=Decimal("3"),  # 3 months
+    ),
+]
+
+EXAMPLE_LEGAL_CLIENT = IncomeClient(
+    contact_phone="+79001234567",
+    display_name="ООО 'Пример Технологии'",
+    income_type=IncomeType.FROM_LEGAL_ENTITY,
+    inn="1234567890",
+)
+
 
 async def phone_challenge_flow_example():
     """
     Example: Phone challenge authentication flow.
     """
 
-    try:
-        client = Client()
+    client = Client()
 
+    try:
         # Step 1: Start phone challenge
         phone = "79999999999"  # Example phone number
 
@@ -49,7 +78,8 @@ async def phone_challenge_flow_example():
 
         # Step 2: Simulate SMS code verification
         # In real usage, get this from user input
-        sms_code = str(input("Введите SMS код: "))  # Example SMS code
+        # Read in a thread so the event loop is not blocked while waiting
+        sms_code = await asyncio.to_thread(input, "Введите SMS код: ")
 
         token_json = await client.create_new_access_token_by_phone(
             phone, challenge_response["challengeToken"], sms_code
@@ -60,11 +90,9 @@ async def phone_challenge_flow_example():
 
         return client
 
-    except PhoneException:
-        return None
-    except UnauthorizedException:
-        return None
-    except Exception:
+    except (DomainException, httpx.HTTPError):
+        # PhoneException, UnauthorizedException, etc. are DomainException
+        await client.aclose()
         return None
 
 
@@ -73,56 +101,32 @@ async def income_creation_example(client: Client):
     Example: Creating income receipts.
     """
 
-    try:
-        income_api = client.income()
+    income_api = client.income()
 
+    # Receipts are independent, so create them concurrently
+    results = await asyncio.gather(
         # Example 1: Simple receipt
-        result = await income_api.create(
+        income_api.create(
             name="Консультационные услуги", amount=Decimal("5000.00"), quantity=1
-        )
-
-        receipt_uuid = result.get("approvedReceiptUuid")
-
+        ),
         # Example 2: Multiple items receipt
-        services = [
-            IncomeServiceItem(
-                name="Разработка веб-сайта",
-                amount=Decimal("25000.00"),
-                quantity=Decimal("1"),
-            ),
-            IncomeServiceItem(
-                name="Техническая поддержка",
-                amount=Decimal("3000.00"),
-                quantity=Decimal("3"),  # 3 months
-            ),
-        ]
-
-        result = await income_api.create_multiple_items(services)
-        multi_receipt_uuid = result.get("approvedReceiptUuid")
-
+        income_api.create_multiple_items(EXAMPLE_SERVICES),
         # Example 3: Receipt for legal entity
-        legal_client = IncomeClient(
-            contact_phone="+79001234567",
-            display_name="ООО 'Пример Технологии'",
-            income_type=IncomeType.FROM_LEGAL_ENTITY,
-            inn="1234567890",
-        )
-
-        result = await income_api.create(
+        income_api.create(
             name="Разработка программного обеспечения",
             amount=Decimal("100000.00"),
             quantity=1,
-            client=legal_client,
-        )
-
-        legal_receipt_uuid = result.get("approvedReceiptUuid")
+            client=EXAMPLE_LEGAL_CLIENT,
+        ),
+        return_exceptions=True,
+    )
 
-        return receipt_uuid, multi_receipt_uuid, legal_receipt_uuid
+    receipt_uuid, multi_receipt_uuid, legal_receipt_uuid = (
+        result.get("approvedReceiptUuid") if isinstance(result, dict) else None
+        for result in results
+    )
 
-    except ValidationException:
-        return None, None, None
-    except Exception:
-        return None, None, None
+    return receipt_uuid, multi_receipt_uuid, legal_receipt_uuid
 
 
 async def receipt_operations_example(client: Client, receipt_uuid: str):
@@ -141,7 +145,7 @@ async def receipt_operations_example(client: Client, receipt_uuid: str):
 
         return receipt_data
 
-    except Exception:
+    except (DomainException, httpx.HTTPError, ValueError):
         return None
 
 
@@ -150,27 +154,21 @@ async def additional_apis_example(client: Client):
     Example: Additional API endpoints.
     """
 
-    try:
-        # User information
-        user_api = client.user()
-        await user_api.get()
-
-        # Payment types
-        payment_api = client.payment_type()
-        await payment_api.table()
-
-        favorite = await payment_api.favorite()
-        if favorite:
-            pass
-
-        # Tax information
-        tax_api = client.tax()
-        await tax_api.get()
-
-        # Tax history
-        await tax_api.history()
-
-    except Exception:
+    user_api = client.user()
+    payment_api = client.payment_type()
+    tax_api = client.tax()
+
+    # Requests are independent, so run them concurrently
+    _user, _table, favorite, _tax, _history = await asyncio.gather(
+        user_api.get(),  # User information
+        payment_api.table(),  # Payment types
+        payment_api.favorite(),
+        tax_api.get(),  # Tax information
+        tax_api.history(),  # Tax history
+        return_exceptions=True,
+    )
+
+    if favorite and not isinstance(favorite, BaseException):
         pass
 
 
@@ -179,22 +177,21 @@ async def error_handling_example():
     Example: Error handling and validation.
     """
 
-    client = Client()
-
-    # Example 1: Authentication error
-    with contextlib.suppress(UnauthorizedException):
-        await client.create_new_access_token(
-            "invalid_inn_example", "invalid_password_example"
-        )
+    async with Client() as client:
+        # Example 1: Authentication error
+        with contextlib.suppress(UnauthorizedException):
+            await client.create_new_access_token(
+                "invalid_inn_example", "invalid_password_example"
+            )
 
-    # Example 2: Validation error
-    with contextlib.suppress(Exception):
-        # This should fail validation
-        IncomeServiceItem(name="", amount=Decimal("-100"), quantity=Decimal("0"))
+        # Example 2: Validation error
+        with contextlib.suppress(ValidationError):
+            # This should fail validation
+            IncomeServiceItem(name="", amount=Decimal("-100"), quantity=Decimal("0"))
 
-    # Example 3: Phone challenge error
-    with contextlib.suppress(PhoneException, DomainException, Exception):
-        await client.create_phone_challenge("invalid_phone")
+        # Example 3: Phone challenge error
+        with contextlib.suppress(DomainException, httpx.HTTPError):
+            await client.create_phone_challenge("invalid_phone")
 
 
 async def token_management_example():
@@ -223,17 +220,18 @@ async def main():
         client = await phone_challenge_flow_example()
 
         if client:
-            # Example 2: Income creation
-            receipt_uuids = await income_creation_example(client)
+            async with client:
+                # Example 2: Income creation
+                receipt_uuids = await income_creation_example(client)
 
-            if receipt_uuids[0]:
-                # Example 3: Receipt operations
-                await receipt_operations_example(client, receipt_uuids[0])
+                if receipt_uuids[0]:
+                    # Example 3: Receipt operations
+                    await receipt_operations_example(client, receipt_uuids[0])
 
-                # Example 4: Additional APIs
-                await additional_apis_example(client)
+                    # Example 4: Additional APIs
+                    await additional_apis_example(client)
 
-    except Exception:
+    except (DomainException, httpx.HTTPError):
         pass
 
     # Example 5: Error handling
@@ -244,10 +242,12 @@ async def main():
 
 
 if __name__ == "__main__":
-    # Run the async example
+    # Run the async example (on uvloop if installed)
+    loop_factory = uvloop.new_event_loop if uvloop else None
     try:
-        asyncio.run(main())
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(main())
     except KeyboardInterrupt:
         pass
-    except Exception:
+    except (DomainException, httpx.HTTPError):
         pass
@@ -3,7 +3,6 @@ Internal HTTP client and authentication middleware.
 Based on PHP library's AuthenticationPlugin and HTTP architecture.
 """
 
-import asyncio
 from abc import ABC, abstractmethod
 from http import HTTPStatus
 from typing import Any
@@ -12,6 +11,9 @@ import httpx
 
 from .exceptions import raise_for_status
 
+# Connection pool limits shared by all pooled httpx clients
+DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
 
 class AuthProvider(ABC):
     """Abstract interface for authentication provider."""
@@ -24,6 +26,23 @@ class AuthProvider(ABC):
     async def refresh(self, refresh_token: str) -> dict[str, Any] | None:
         """Refresh access token using refresh token."""
 
+    async def get_valid_token(self) -> dict[str, Any] | None:
+        """Get access token data suitable for an outgoing request."""
+        return await self.get_token()
+
+    async def refresh_token_data(
+        self, token_data: dict[str, Any] | None
+    ) -> dict[str, Any] | None:
+        """
+        Refresh given token data (e.g. the one rejected with 401).
+
+        Implementations should coalesce concurrent calls so that only one
+        refresh request is made per token.
+        """
+        if not token_data or "refreshToken" not in token_data:
+            return None
+        return await self.refresh(token_data["refreshToken"])
+
 
 class AsyncHTTPClient:
     """
@@ -33,6 +52,10 @@ class AsyncHTTPClient:
     - Adds Bearer authorization header
     - On 401 response, attempts token refresh once
     - Retries request with new token (max 2 attempts)
+
+    A single httpx.AsyncClient is created lazily on first request and reused
+    for all subsequent calls, so keep-alive connections are pooled between
+    requests. Call aclose() to release them.
     """
 
     def __init__(
@@ -46,44 +69,54 @@ class AsyncHTTPClient:
         self.auth_provider = auth_provider
         self.default_headers = default_headers or {}
         self.timeout = timeout
-        self._refresh_lock = asyncio.Lock()
         self.max_retries = 2  # Same as PHP AuthenticationPlugin::RETRY_LIMIT
+        self._client: httpx.AsyncClient | None = None
 
-    async def _get_auth_headers(self) -> dict[str, str]:
-        """Get authorization headers from current token."""
-        token_data = await self.auth_provider.get_token()
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get pooled httpx client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                limits=DEFAULT_LIMITS, timeout=self.timeout
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close pooled httpx client and release its connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @staticmethod
+    def _get_auth_headers(token_data: dict[str, Any] | None) -> dict[str, str]:
+        """Get authorization headers from token data."""
         if not token_data or "token" not in token_data:
             return {}
 
         return {"Authorization": f"Bearer {token_data['token']}"}
 
     async def _handle_401_response(
-        self, client: httpx.AsyncClient, request: httpx.Request
+        self,
+        client: httpx.AsyncClient,
+        request: httpx.Request,
+        token_data: dict[str, Any] | None,
     ) -> httpx.Response | None:
         """
         Handle 401 response by refreshing token and retrying request.
 
-        Uses asyncio.Lock to prevent concurrent refresh attempts,
-        similar to PHP's retry storage mechanism.
+        Refresh goes through the auth provider, which coalesces concurrent
+        attempts (including background refresh of stale token), similar to
+        PHP's retry storage mechanism.
         """
-        async with self._refresh_lock:
-            token_data = await self.auth_provider.get_token()
-            if not token_data or "refreshToken" not in token_data:
-                return None
-
-            # Attempt token refresh
-            new_token_data = await self.auth_provider.refresh(
-                token_data["refreshToken"]
-            )
-            if not new_token_data or "token" not in new_token_data:
-                return None
+        # Attempt refresh of the token rejected by the server
+        new_token_data = await self.auth_provider.refresh_token_data(token_data)
+        if not new_token_data or "token" not in new_token_data:
+            return None
 
-            # Update request with new authorization header
-            new_auth_headers = {"Authorization": f"Bearer {new_token_data['token']}"}
-            request.headers.update(new_auth_headers)
+        # Update request with new authorization header
+        request.headers.update(self._get_auth_headers(new_token_data))
 
-            # Retry request with new token
-            return await client.send(request)
+        # Retry request with new token
+        return await client.send(request)
 
     async def request(
         self,
@@ -111,8 +144,8 @@ class AsyncHTTPClient:
         """
         # Prepare headers
         request_headers = self.default_headers.copy()
-        auth_headers = await self._get_auth_headers()
-        request_headers.update(auth_headers)
+        token_data = await self.auth_provider.get_valid_token()
+        request_headers.update(self._get_auth_headers(token_data))
         if headers:
             request_headers.update(headers)
 
@@ -128,22 +161,25 @@ class AsyncHTTPClient:
         if json_data is not None:
             request_kwargs["json"] = json_data
 
-        async with httpx.AsyncClient() as client:
-            # Initial request
-            response = await client.request(**request_kwargs)
+        client = self._get_client()
+
+        # Initial request
+        response = await client.request(**request_kwargs)
 
-            # Handle 401 with token refresh (max 1 retry)
-            if response.status_code == HTTPStatus.UNAUTHORIZED:
-                # Build request object for retry
-                request = client.build_request(**request_kwargs)
-                retry_response = await self._handle_401_response(client, request)
-                if retry_response is not None:
-                    response = retry_response
+        # Handle 401 with token refresh (max 1 retry)
+        if response.status_code == HTTPStatus.UNAUTHORIZED:
+            # Build request object for retry
+            request = client.build_request(**request_kwargs)
+            retry_response = await self._handle_401_response(
+                client, request, token_data
+            )
+            if retry_response is not None:
+                response = retry_response
 
-            # Check for domain exceptions
-            raise_for_status(response)
+        # Check for domain exceptions
+        raise_for_status(response)
 
-            return response
+        return response
 
     async def get(
         self,
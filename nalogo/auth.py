@@ -3,18 +3,24 @@ Authentication provider implementation.
 Based on PHP library's Authenticator class.
 """
 
+import asyncio
 import json
 import uuid
+from datetime import UTC, datetime, timedelta
 from http import HTTPStatus
 from pathlib import Path
 from typing import Any
 
 import httpx
 
-from ._http import AuthProvider
+from ._http import DEFAULT_LIMITS, AuthProvider
 from .dto.device import DeviceInfo
 from .exceptions import raise_for_status
 
+# Token is considered stale (refreshed in background) during the last
+# minutes of its lifetime
+TOKEN_STALE_THRESHOLD = timedelta(minutes=3)
+
 
 def generate_device_id() -> str:
     """Generate device ID similar to PHP's DeviceIdGenerator."""
@@ -33,6 +39,9 @@ class AuthProviderImpl(AuthProvider):
     - Phone-based authentication (2-step: challenge + verify)
     - Token refresh
     - Token storage (in-memory or file-based)
+
+    Tokens close to expiration are refreshed in background
+    (stale-while-revalidate), expired tokens are refreshed before use.
     """
 
     def __init__(
@@ -47,6 +56,9 @@ class AuthProviderImpl(AuthProvider):
         self.device_id = device_id or generate_device_id()
         self.device_info = DeviceInfo(sourceDeviceId=self.device_id)
         self._token_data: dict[str, Any] | None = None
+        self._client: httpx.AsyncClient | None = None
+        self._refresh_lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task[None] | None = None
 
         # Default headers similar to PHP Authenticator
         self.default_headers = {
@@ -60,6 +72,22 @@ class AuthProviderImpl(AuthProvider):
         if self.storage_path:
             self._load_token_from_storage()
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get pooled httpx client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(limits=DEFAULT_LIMITS, timeout=10.0)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close pooled httpx client and release its connections."""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_task.cancel()
+        self._refresh_task = None
+
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     def _load_token_from_storage(self) -> None:
         """Load token from file storage."""
         if not self.storage_path:
@@ -95,6 +123,82 @@ class AuthProviderImpl(AuthProvider):
         """Get current access token data."""
         return self._token_data
 
+    def _get_token_expire_time(self) -> datetime | None:
+        """Get access token expiration time or None if it is unknown."""
+        if not self._token_data:
+            return None
+
+        expire_in = self._token_data.get("tokenExpireIn")
+        if not isinstance(expire_in, str):
+            return None
+
+        try:
+            expire_time = datetime.fromisoformat(expire_in)
+        except ValueError:
+            return None
+
+        if expire_time.tzinfo is None:
+            expire_time = expire_time.replace(tzinfo=UTC)
+        return expire_time
+
+    async def get_valid_token(self) -> dict[str, Any] | None:
+        """
+        Get access token data, refreshing it if needed.
+
+        - fresh token: returned as is
+        - stale token (expires within TOKEN_STALE_THRESHOLD): returned as is,
+          refresh is started in background
+        - expired token: refreshed before returning
+
+        Concurrent callers share a single refresh request.
+        """
+        expire_time = self._get_token_expire_time()
+        if expire_time is None:
+            return self._token_data
+
+        token_data = self._token_data
+        time_left = expire_time - datetime.now(UTC)
+        if time_left <= timedelta(0):
+            await self.refresh_token_data(token_data)
+        elif time_left <= TOKEN_STALE_THRESHOLD:
+            self._schedule_token_refresh(token_data)
+
+        return self._token_data
+
+    def _schedule_token_refresh(self, token_data: dict[str, Any] | None) -> None:
+        """Start background token refresh unless one is already running."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(
+                self._refresh_in_background(token_data)
+            )
+
+    async def _refresh_in_background(self, token_data: dict[str, Any] | None) -> None:
+        """Run refresh_token_data() as a background task."""
+        await self.refresh_token_data(token_data)
+
+    async def refresh_token_data(
+        self, token_data: dict[str, Any] | None
+    ) -> dict[str, Any] | None:
+        """
+        Refresh given token data once, coalescing concurrent attempts.
+
+        Used for expired and stale tokens and for 401 retries. If the token
+        was already replaced (by another refresh or authentication), the
+        current token is returned without a new refresh request.
+
+        Args:
+            token_data: Token data that needs refresh
+
+        Returns:
+            Current token data after refresh or None if refresh failed
+        """
+        async with self._refresh_lock:
+            if self._token_data is not token_data:
+                return self._token_data
+            if not token_data or "refreshToken" not in token_data:
+                return None
+            return await self.refresh(token_data["refreshToken"])
+
     async def set_token(self, token_json: str) -> None:
         """
         Set access token from JSON string.
@@ -103,11 +207,25 @@ class AuthProviderImpl(AuthProvider):
             token_json: JSON string containing token data
         """
         try:
-            self._token_data = json.loads(token_json)
-            self._save_token_to_storage()
+            token_data = json.loads(token_json)
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid token JSON: {e}") from e
 
+        await self.set_token_data(token_data)
+
+    async def set_token_data(self, token_data: dict[str, Any]) -> None:
+        """
+        Set access token from already parsed token data.
+
+        Args:
+            token_data: Dictionary with token data
+        """
+        self._token_data = token_data
+
+        # Write file in a thread so disk I/O does not block the event loop
+        if self.storage_path:
+            await asyncio.to_thread(self._save_token_to_storage)
+
     async def create_new_access_token(self, username: str, password: str) -> str:
         """
         Create new access token using INN and password.
@@ -130,20 +248,20 @@ class AuthProviderImpl(AuthProvider):
             "deviceInfo": self.device_info.model_dump(),
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url_v1}/auth/lkfl",
-                json=request_data,
-                headers=self.default_headers,
-                timeout=10.0,
-            )
+        client = self._get_client()
+        response = await client.post(
+            f"{self.base_url_v1}/auth/lkfl",
+            json=request_data,
+            headers=self.default_headers,
+            timeout=10.0,
+        )
 
-            raise_for_status(response)
+        raise_for_status(response)
 
-            # Store and return token
-            token_json = response.text
-            await self.set_token(token_json)
-            return token_json
+        # Store and return token
+        token_json = response.text
+        await self.set_token(token_json)
+        return token_json
 
     async def create_phone_challenge(self, phone: str) -> dict[str, Any]:
         """
@@ -165,16 +283,16 @@ class AuthProviderImpl(AuthProvider):
             "requireTpToBeActive": True,
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url_v2}/auth/challenge/sms/start",
-                json=request_data,
-                headers=self.default_headers,
-                timeout=10.0,
-            )
+        client = self._get_client()
+        response = await client.post(
+            f"{self.base_url_v2}/auth/challenge/sms/start",
+            json=request_data,
+            headers=self.default_headers,
+            timeout=10.0,
+        )
 
-            raise_for_status(response)
-            return response.json()  # type: ignore[no-any-return]
+        raise_for_status(response)
+        return response.json()  # type: ignore[no-any-return]
 
     async def create_new_access_token_by_phone(
         self, phone: str, challenge_token: str, verification_code: str
@@ -202,20 +320,20 @@ class AuthProviderImpl(AuthProvider):
             "deviceInfo": self.device_info.model_dump(),
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url_v1}/auth/challenge/sms/verify",
-                json=request_data,
-                headers=self.default_headers,
-                timeout=10.0,
-            )
+        client = self._get_client()
+        response = await client.post(
+            f"{self.base_url_v1}/auth/challenge/sms/verify",
+            json=request_data,
+            headers=self.default_headers,
+            timeout=10.0,
+        )
 
-            raise_for_status(response)
+        raise_for_status(response)
 
-            # Store and return token
-            token_json = response.text
-            await self.set_token(token_json)
-            return token_json
+        # Store and return token
+        token_json = response.text
+        await self.set_token(token_json)
+        return token_json
 
     async def refresh(self, refresh_token: str) -> dict[str, Any] | None:
         """
@@ -235,22 +353,22 @@ class AuthProviderImpl(AuthProvider):
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.base_url_v1}/auth/token",
-                    json=request_data,
-                    headers=self.default_headers,
-                    timeout=10.0,
-                )
-
-                # PHP version only checks for 200 status
-                if response.status_code != HTTPStatus.OK:
-                    return None
-
-                # Store and return new token data
-                token_json = response.text
-                await self.set_token(token_json)
-                return self._token_data
+            client = self._get_client()
+            response = await client.post(
+                f"{self.base_url_v1}/auth/token",
+                json=request_data,
+                headers=self.default_headers,
+                timeout=10.0,
+            )
+
+            # PHP version only checks for 200 status
+            if response.status_code != HTTPStatus.OK:
+                return None
+
+            # Store and return new token data
+            token_json = response.text
+            await self.set_token(token_json)
+            return self._token_data
 
         except Exception:
             # Silently fail refresh attempts like PHP version
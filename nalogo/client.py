@@ -4,7 +4,8 @@ Based on PHP library's ApiClient class.
 """
 
 import json
-from typing import Any
+from types import TracebackType
+from typing import Any, Self
 
 from ._http import AsyncHTTPClient
 from .auth import AuthProviderImpl
@@ -22,12 +23,15 @@ class Client:
     Provides factory methods for API modules and authentication methods.
     Maps to PHP ApiClient functionality with async support.
 
+    HTTP connections are pooled and reused between calls. Use the client
+    as an async context manager (or call aclose()) to release them.
+
     Example:
-        >>> client = Client()
-        >>> token = await client.create_new_access_token("inn", "password")
-        >>> await client.authenticate(token)
-        >>> income_api = client.income()
-        >>> result = await income_api.create("Service", 100, 1)
+        >>> async with Client() as client:
+        ...     token = await client.create_new_access_token("inn", "password")
+        ...     await client.authenticate(token)
+        ...     income_api = client.income()
+        ...     result = await income_api.create("Service", 100, 1)
     """
 
     def __init__(
@@ -72,6 +76,30 @@ class Client:
         # User profile data (for receipt operations)
         self._user_profile: dict[str, Any] | None = None
 
+        # API modules are stateless wrappers over http_client, so they are
+        # created once and reused by the factory methods
+        self._income_api = IncomeAPI(self.http_client)
+        self._payment_type_api = PaymentTypeAPI(self.http_client)
+        self._tax_api = TaxAPI(self.http_client)
+        self._user_api = UserAPI(self.http_client)
+        self._receipt_api: ReceiptAPI | None = None
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close pooled HTTP connections of the client."""
+        await self.http_client.aclose()
+        await self.auth_provider.aclose()
+
     async def create_new_access_token(self, username: str, password: str) -> str:
         """
         Create new access token using INN and password.
@@ -155,6 +183,20 @@ class Client:
             # If token parsing fails, profile will remain None
             pass
 
+    async def authenticate_dict(self, token_data: dict[str, Any]) -> None:
+        """
+        Authenticate client with already parsed token data.
+
+        Same as authenticate() but skips JSON decoding.
+
+        Args:
+            token_data: Dictionary with token data
+        """
+        await self.auth_provider.set_token_data(token_data)
+
+        if "profile" in token_data:
+            self._user_profile = token_data["profile"]
+
     async def get_access_token(self) -> str | None:
         """
         Get current access token (may be refreshed).
@@ -178,7 +220,7 @@ class Client:
         Returns:
             IncomeAPI instance for creating/cancelling receipts
         """
-        return IncomeAPI(self.http_client)
+        return self._income_api
 
     def receipt(self) -> ReceiptAPI:
         """
@@ -195,11 +237,15 @@ class Client:
         if not self._user_profile or "inn" not in self._user_profile:
             raise ValueError("User profile not available. Please authenticate first.")
 
-        return ReceiptAPI(
-            http_client=self.http_client,
-            base_endpoint=self.base_url,
-            user_inn=self._user_profile["inn"],
-        )
+        # Reuse instance unless profile INN changed after re-authentication
+        user_inn = self._user_profile["inn"]
+        if self._receipt_api is None or self._receipt_api.user_inn != user_inn:
+            self._receipt_api = ReceiptAPI(
+                http_client=self.http_client,
+                base_endpoint=self.base_url,
+                user_inn=user_inn,
+            )
+        return self._receipt_api
 
     def payment_type(self) -> PaymentTypeAPI:
         """
@@ -210,7 +256,7 @@ class Client:
         Returns:
             PaymentTypeAPI instance for managing payment methods
         """
-        return PaymentTypeAPI(self.http_client)
+        return self._payment_type_api
 
     def tax(self) -> TaxAPI:
         """
@@ -221,7 +267,7 @@ class Client:
         Returns:
             TaxAPI instance for tax information and history
         """
-        return TaxAPI(self.http_client)
+        return self._tax_api
 
     def user(self) -> UserAPI:
         """
@@ -232,4 +278,4 @@ class Client:
         Returns:
             UserAPI instance for user information
         """
-        return UserAPI(self.http_client)
+        return self._user_api
@@ -10,6 +10,7 @@ from .income import (
     IncomeServiceItem,
     IncomeType,
     PaymentType,
+    total_amount,
 )
 from .invoice import InvoiceClient, InvoiceServiceItem
 from .payment_type import PaymentType as PaymentTypeModel
@@ -43,4 +44,5 @@ __all__ = [
     "Tax",
     # User DTOs
     "UserType",
+    "total_amount",
 ]
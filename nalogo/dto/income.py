@@ -8,7 +8,7 @@ from decimal import Decimal
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field, field_serializer, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
 
 
 class IncomeType(str, Enum):
@@ -68,8 +68,13 @@ class IncomeServiceItem(BaseModel):
     """
     Service item for income creation.
     Maps to PHP DTO\\IncomeServiceItem.
+
+    For trusted, already valid data use IncomeServiceItem.model_construct()
+    to skip validation.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     name: str = Field(..., description="Service name/description")
     amount: Decimal = Field(..., description="Service amount", gt=0)
     quantity: Decimal = Field(..., description="Service quantity", gt=0)
@@ -109,24 +114,45 @@ class IncomeServiceItem(BaseModel):
         }
 
 
+def total_amount(items: list[IncomeServiceItem]) -> Decimal:
+    """
+    Calculate total amount of service items (sum of amount * quantity).
+
+    Reads item attributes directly instead of calling get_total_amount()
+    for each item, which matters for receipts with many line items.
+    """
+    return sum((item.amount * item.quantity for item in items), Decimal(0))
+
+
 class IncomeClient(BaseModel):
     """
     Client information for income creation.
     Maps to PHP DTO\\IncomeClient.
     """
 
-    contact_phone: str | None = Field(default=None, description="Client contact phone")
-    display_name: str | None = Field(default=None, description="Client display name")
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    contact_phone: str | None = Field(
+        default=None,
+        description="Client contact phone",
+        serialization_alias="contactPhone",
+    )
+    display_name: str | None = Field(
+        default=None,
+        description="Client display name",
+        serialization_alias="displayName",
+    )
     income_type: IncomeType = Field(
-        default=IncomeType.FROM_INDIVIDUAL, description="Income type"
+        default=IncomeType.FROM_INDIVIDUAL,
+        description="Income type",
+        serialization_alias="incomeType",
     )
     inn: str | None = Field(default=None, description="Client INN (tax ID)")
 
     @field_validator("inn")
     @classmethod
-    def validate_inn(cls, v: str | None, info: Any) -> str | None:
+    def validate_inn(cls, v: str | None) -> str | None:
         """Validate INN format for legal entities."""
-        _ = info
         if v is None:
             return v
 
@@ -147,11 +173,8 @@ class IncomeClient(BaseModel):
 
     @field_validator("display_name")
     @classmethod
-    def validate_display_name_for_legal_entity(
-        cls, v: str | None, info: Any
-    ) -> str | None:
+    def validate_display_name_for_legal_entity(cls, v: str | None) -> str | None:
         """Validate display name is provided for legal entities."""
-        _ = info
         # Note: This validation is applied in the API layer in PHP,
         # but we can do basic validation here
         if v is not None:
@@ -175,15 +198,33 @@ class IncomeRequest(BaseModel):
     """
     Complete income creation request.
     Maps to PHP request structure in Income::createMultipleItems().
+
+    model_dump_json(by_alias=True) produces the same payload as model_dump()
+    directly as JSON.
     """
 
-    operation_time: AtomDateTime = Field(default_factory=AtomDateTime.now)
-    request_time: AtomDateTime = Field(default_factory=AtomDateTime.now)
+    operation_time: AtomDateTime = Field(
+        default_factory=AtomDateTime.now, serialization_alias="operationTime"
+    )
+    request_time: AtomDateTime = Field(
+        default_factory=AtomDateTime.now, serialization_alias="requestTime"
+    )
     services: list[IncomeServiceItem] = Field(..., min_length=1)
-    total_amount: str = Field(..., description="Total amount as string")
+    total_amount: str = Field(
+        ..., description="Total amount as string", serialization_alias="totalAmount"
+    )
     client: IncomeClient = Field(default_factory=IncomeClient)
-    payment_type: PaymentType = Field(default=PaymentType.CASH)
-    ignore_max_total_income_restriction: bool = Field(default=False)
+    payment_type: PaymentType = Field(
+        default=PaymentType.CASH, serialization_alias="paymentType"
+    )
+    ignore_max_total_income_restriction: bool = Field(
+        default=False, serialization_alias="ignoreMaxTotalIncomeRestriction"
+    )
+
+    @field_serializer("operation_time", "request_time")
+    def serialize_atom_datetime(self, value: AtomDateTime) -> str:
+        """Serialize AtomDateTime as plain ATOM string."""
+        return value.serialize_datetime(value.value)
 
     @field_validator("services")
     @classmethod
@@ -215,13 +256,29 @@ class CancelRequest(BaseModel):
     """
     Income cancellation request.
     Maps to PHP request structure in Income::cancel().
+
+    model_dump_json(by_alias=True) produces the same payload as model_dump()
+    directly as JSON.
     """
 
-    operation_time: AtomDateTime = Field(default_factory=AtomDateTime.now)
-    request_time: AtomDateTime = Field(default_factory=AtomDateTime.now)
+    operation_time: AtomDateTime = Field(
+        default_factory=AtomDateTime.now, serialization_alias="operationTime"
+    )
+    request_time: AtomDateTime = Field(
+        default_factory=AtomDateTime.now, serialization_alias="requestTime"
+    )
     comment: CancelCommentType = Field(..., description="Cancellation reason")
-    receipt_uuid: str = Field(..., description="Receipt UUID to cancel")
-    partner_code: str | None = Field(default=None, description="Partner code")
+    receipt_uuid: str = Field(
+        ..., description="Receipt UUID to cancel", serialization_alias="receiptUuid"
+    )
+    partner_code: str | None = Field(
+        default=None, description="Partner code", serialization_alias="partnerCode"
+    )
+
+    @field_serializer("operation_time", "request_time")
+    def serialize_atom_datetime(self, value: AtomDateTime) -> str:
+        """Serialize AtomDateTime as plain ATOM string."""
+        return value.serialize_datetime(value.value)
 
     @field_validator("receipt_uuid")
     @classmethod
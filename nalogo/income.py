@@ -17,8 +17,13 @@ from .dto.income import (
     IncomeServiceItem,
     IncomeType,
     PaymentType,
+    total_amount,
 )
 
+# Request bodies are sent as pre-serialized JSON content, so httpx does not
+# set the content type by itself
+JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class IncomeAPI:
     """
@@ -104,7 +109,7 @@ class IncomeAPI:
                 raise ValueError("Client DisplayName cannot be empty for legal entity")
 
         # Calculate total amount (mirrors PHP BigDecimal logic)
-        total_amount = sum(item.get_total_amount() for item in services)
+        services_total = total_amount(services)
 
         # Create request object
         request = IncomeRequest(
@@ -115,14 +120,19 @@ class IncomeAPI:
             ),
             request_time=AtomDateTime.now(),
             services=services,
-            total_amount=str(total_amount),
+            total_amount=str(services_total),
             client=client or IncomeClient(),
             payment_type=PaymentType.CASH,
             ignore_max_total_income_restriction=False,
         )
 
         # Make API request
-        response = await self.http.post("/income", json_data=request.model_dump())
+        # Serialize straight to JSON, without intermediate dict
+        response = await self.http.post(
+            "/income",
+            content=request.model_dump_json(by_alias=True),
+            headers=JSON_HEADERS,
+        )
         return response.json()  # type: ignore[no-any-return]
 
     async def cancel(
@@ -191,5 +201,9 @@ class IncomeAPI:
         )
 
         # Make API request
-        response = await self.http.post("/cancel", json_data=request.model_dump())
+        response = await self.http.post(
+            "/cancel",
+            content=request.model_dump_json(by_alias=True),
+            headers=JSON_HEADERS,
+        )
         return response.json()  # type: ignore[no-any-return]
@@ -23,6 +23,9 @@ class ReceiptAPI:
         self.http = http_client
         self.base_endpoint = base_endpoint
         self.user_inn = user_inn
+        # URL prefix is the same for all receipts of the user
+        self._receipt_path_prefix = f"/receipt/{user_inn}/"
+        self._print_url_prefix = f"{base_endpoint}{self._receipt_path_prefix}"
 
     def print_url(self, receipt_uuid: str) -> str:
         """
@@ -40,12 +43,12 @@ class ReceiptAPI:
         Raises:
             ValueError: If receipt_uuid is empty
         """
-        if not receipt_uuid.strip():
+        receipt_uuid = receipt_uuid.strip()
+        if not receipt_uuid:
             raise ValueError("Receipt UUID cannot be empty")
 
         # Compose URL like PHP: sprintf('/receipt/%s/%s/print', $this->profile->getInn(), $receiptUuid)
-        path = f"/receipt/{self.user_inn}/{receipt_uuid.strip()}/print"
-        return f"{self.base_endpoint}{path}"
+        return f"{self._print_url_prefix}{receipt_uuid}/print"
 
     async def json(self, receipt_uuid: str) -> dict[str, Any]:
         """
@@ -63,11 +66,12 @@ class ReceiptAPI:
             ValueError: If receipt_uuid is empty
             DomainException: For API errors
         """
-        if not receipt_uuid.strip():
+        receipt_uuid = receipt_uuid.strip()
+        if not receipt_uuid:
             raise ValueError("Receipt UUID cannot be empty")
 
         # Make GET request like PHP: sprintf('/receipt/%s/%s/json', $this->profile->getInn(), $receiptUuid)
-        path = f"/receipt/{self.user_inn}/{receipt_uuid.strip()}/json"
+        path = f"{self._receipt_path_prefix}{receipt_uuid}/json"
         response = await self.http.get(path)
 
         return response.json()  # type: ignore[no-any-return]
@@ -3,7 +3,9 @@ Async tests for authentication functionality.
 Tests auth flows, token refresh middleware, and error handling.
 """
 
+import asyncio
 import json
+from datetime import UTC, datetime, timedelta
 
 import httpx
 import pytest
@@ -20,7 +22,7 @@ def sample_token_response():
     return {
         "token": "sample_access_token",
         "refreshToken": "sample_refresh_token",
-        "tokenExpireIn": "2024-12-31T23:59:59.999Z",
+        "tokenExpireIn": (datetime.now(UTC) + timedelta(hours=1)).isoformat(),
         "refreshTokenExpiresIn": None,
         "profile": {
             "id": 1000000,
@@ -150,6 +152,124 @@ class TestAuthProviderImpl:
             assert result is None
 
 
+def _token_expiring_in(token_response: dict, delta: timedelta) -> str:
+    """Build token JSON with tokenExpireIn shifted from now by delta."""
+    expire_time = datetime.now(UTC) + delta
+    return json.dumps({**token_response, "tokenExpireIn": expire_time.isoformat()})
+
+
+class TestTokenCache:
+    """Test stale-while-revalidate token refresh."""
+
+    @pytest.mark.asyncio
+    async def test_fresh_token_is_not_refreshed(self, sample_token_response):
+        """Test that fresh token is returned without refresh."""
+        with respx.mock(
+            base_url="https://lknpd.nalog.ru/api/v1", assert_all_called=False
+        ) as respx_mock:
+            refresh_mock = respx_mock.post("/auth/token")
+
+            auth_provider = AuthProviderImpl()
+            await auth_provider.set_token(
+                _token_expiring_in(sample_token_response, timedelta(hours=1))
+            )
+
+            token_data = await auth_provider.get_valid_token()
+
+            assert token_data["token"] == "sample_access_token"
+            assert not refresh_mock.called
+
+    @pytest.mark.asyncio
+    async def test_stale_token_refreshed_in_background(self, sample_token_response):
+        """Test that stale token is returned and refreshed in background."""
+        new_token_response = {**sample_token_response, "token": "new_access_token"}
+
+        with respx.mock(base_url="https://lknpd.nalog.ru/api/v1") as respx_mock:
+            refresh_mock = respx_mock.post("/auth/token").mock(
+                return_value=httpx.Response(200, text=json.dumps(new_token_response))
+            )
+
+            auth_provider = AuthProviderImpl()
+            await auth_provider.set_token(
+                _token_expiring_in(sample_token_response, timedelta(minutes=1))
+            )
+
+            token_data = await auth_provider.get_valid_token()
+            assert token_data["token"] == "sample_access_token"
+
+            await auth_provider._refresh_task
+            assert refresh_mock.call_count == 1
+            token_data = await auth_provider.get_token()
+            assert token_data["token"] == "new_access_token"
+
+    @pytest.mark.asyncio
+    async def test_expired_token_refreshed_once(self, sample_token_response):
+        """Test that concurrent callers share a single refresh of expired token."""
+        new_token_response = {
+            **sample_token_response,
+            "token": "new_access_token",
+            "tokenExpireIn": (datetime.now(UTC) + timedelta(hours=1)).isoformat(),
+        }
+
+        with respx.mock(base_url="https://lknpd.nalog.ru/api/v1") as respx_mock:
+            refresh_mock = respx_mock.post("/auth/token").mock(
+                return_value=httpx.Response(200, text=json.dumps(new_token_response))
+            )
+
+            auth_provider = AuthProviderImpl()
+            await auth_provider.set_token(
+                _token_expiring_in(sample_token_response, timedelta(minutes=-1))
+            )
+
+            results = await asyncio.gather(
+                auth_provider.get_valid_token(), auth_provider.get_valid_token()
+            )
+
+            assert [r["token"] for r in results] == ["new_access_token"] * 2
+            assert refresh_mock.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_token_and_401_refresh_once(self, sample_token_response):
+        """Test that background refresh and 401 retry share one refresh."""
+        new_token_response = {
+            **sample_token_response,
+            "token": "new_access_token",
+            "tokenExpireIn": (datetime.now(UTC) + timedelta(hours=1)).isoformat(),
+        }
+
+        with respx.mock(base_url="https://lknpd.nalog.ru/api/v1") as respx_mock:
+            respx_mock.post("/income").side_effect = [
+                httpx.Response(401, text="Unauthorized"),
+                httpx.Response(200, json={"approvedReceiptUuid": "test-uuid"}),
+            ]
+            refresh_mock = respx_mock.post("/auth/token").mock(
+                return_value=httpx.Response(200, text=json.dumps(new_token_response))
+            )
+
+            async with Client() as client:
+                await client.authenticate(
+                    _token_expiring_in(sample_token_response, timedelta(minutes=1))
+                )
+
+                result = await client.income().create("Test Service", 100, 1)
+                refresh_task = client.auth_provider._refresh_task
+                if refresh_task is not None:
+                    await refresh_task
+
+            assert result["approvedReceiptUuid"] == "test-uuid"
+            assert refresh_mock.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_token_saved_to_storage(self, sample_token_response, tmp_path):
+        """Test that token is written to storage file when path is set."""
+        storage_path = tmp_path / "token.json"
+        auth_provider = AuthProviderImpl(storage_path=str(storage_path))
+
+        await auth_provider.set_token_data(sample_token_response)
+
+        assert json.loads(storage_path.read_text()) == sample_token_response
+
+
 class TestClient:
     """Test main Client facade."""
 
@@ -205,6 +325,44 @@ class TestClient:
         receipt_api = client.receipt()
         assert receipt_api.user_inn == "123456789012"
 
+    @pytest.mark.asyncio
+    async def test_authenticate_dict(self, sample_token_response):
+        """Test client authentication with already parsed token data."""
+        client = Client()
+
+        await client.authenticate_dict(sample_token_response)
+
+        retrieved_token = await client.get_access_token()
+        assert json.loads(retrieved_token) == sample_token_response
+        assert client.receipt().user_inn == "123456789012"
+
+    @pytest.mark.asyncio
+    async def test_api_instances_are_reused(self, sample_token_response):
+        """Test that factory methods return cached API instances."""
+        client = Client()
+        await client.authenticate_dict(sample_token_response)
+
+        assert client.income() is client.income()
+        assert client.payment_type() is client.payment_type()
+        assert client.tax() is client.tax()
+        assert client.user() is client.user()
+        assert client.receipt() is client.receipt()
+
+    @pytest.mark.asyncio
+    async def test_receipt_api_follows_profile_change(self, sample_token_response):
+        """Test that receipt API is recreated when profile INN changes."""
+        client = Client()
+        await client.authenticate_dict(sample_token_response)
+        receipt_api = client.receipt()
+
+        other_profile = {**sample_token_response["profile"], "inn": "210987654321"}
+        await client.authenticate_dict(
+            {**sample_token_response, "profile": other_profile}
+        )
+
+        assert client.receipt() is not receipt_api
+        assert client.receipt().user_inn == "210987654321"
+
     @pytest.mark.asyncio
     async def test_receipt_requires_authentication(self):
         """Test that receipt API requires authentication."""
@@ -299,3 +457,39 @@ class TestRefreshMiddleware:
 
             with pytest.raises(UnauthorizedException):
                 await income_api.create("Test Service", 100, 1)
+
+
+class TestConnectionPooling:
+    """Test HTTP connection reuse between requests."""
+
+    @pytest.mark.asyncio
+    async def test_http_client_reused_between_requests(self, sample_token_response):
+        """Test that sequential requests share one pooled httpx client."""
+        with respx.mock(base_url="https://lknpd.nalog.ru/api/v1") as respx_mock:
+            respx_mock.get("/user").mock(return_value=httpx.Response(200, json={}))
+            respx_mock.get("/taxes").mock(return_value=httpx.Response(200, json={}))
+
+            async with Client() as client:
+                await client.authenticate(json.dumps(sample_token_response))
+
+                await client.user().get()
+                pooled_client = client.http_client._client
+                await client.tax().get()
+
+                assert pooled_client is not None
+                assert client.http_client._client is pooled_client
+
+    @pytest.mark.asyncio
+    async def test_async_context_manager_closes_pool(self, sample_token_response):
+        """Test that leaving async with block closes pooled connections."""
+        with respx.mock(base_url="https://lknpd.nalog.ru/api/v1") as respx_mock:
+            respx_mock.get("/user").mock(return_value=httpx.Response(200, json={}))
+
+            async with Client() as client:
+                await client.authenticate(json.dumps(sample_token_response))
+                await client.user().get()
+                pooled_client = client.http_client._client
+
+        assert pooled_client is not None
+        assert pooled_client.is_closed
+        assert client.http_client._client is None
@@ -11,13 +11,19 @@ import pytest
 import respx
 from pydantic import ValidationError
 
+from nalogo._http import AsyncHTTPClient
+from nalogo.auth import AuthProviderImpl
 from nalogo.client import Client
 from nalogo.dto.income import (
     CancelCommentType,
+    CancelRequest,
     IncomeClient,
+    IncomeRequest,
     IncomeServiceItem,
     IncomeType,
+    total_amount,
 )
+from nalogo.income import IncomeAPI
 
 
 @pytest.fixture
@@ -328,6 +334,35 @@ class TestIncomeAPI:
             await income_api.cancel("test-uuid", "Invalid comment")
 
 
+class TestIncomeRequestHeaders:
+    """Test headers of income requests sent as JSON content."""
+
+    @pytest.mark.asyncio
+    async def test_json_content_type_without_default_headers(self, income_response):
+        """Test that income requests set JSON content type themselves."""
+        http_client = AsyncHTTPClient(
+            base_url="https://lknpd.nalog.ru/api/v1",
+            auth_provider=AuthProviderImpl(),
+        )
+        income_api = IncomeAPI(http_client)
+
+        with respx.mock(base_url="https://lknpd.nalog.ru/api/v1") as respx_mock:
+            income_mock = respx_mock.post("/income").mock(
+                return_value=httpx.Response(200, json=income_response)
+            )
+            cancel_mock = respx_mock.post("/cancel").mock(
+                return_value=httpx.Response(200, json={})
+            )
+
+            await income_api.create("Test Service", 100, 1)
+            await income_api.cancel("test-uuid", CancelCommentType.CANCEL)
+            await http_client.aclose()
+
+        for mock in (income_mock, cancel_mock):
+            request = mock.calls[0].request
+            assert request.headers["Content-Type"] == "application/json"
+
+
 class TestIncomeServiceItem:
     """Test IncomeServiceItem DTO validation and serialization."""
 
@@ -375,6 +410,49 @@ class TestIncomeServiceItem:
             "quantity": "2",
         }
 
+    def test_total_amount(self):
+        """Test total amount of several service items."""
+        items = [
+            IncomeServiceItem(
+                name="Service 1", amount=Decimal("100.50"), quantity=Decimal("2")
+            ),
+            IncomeServiceItem(
+                name="Service 2", amount=Decimal("50.25"), quantity=Decimal("3")
+            ),
+        ]
+
+        assert total_amount(items) == Decimal("351.75")
+        assert total_amount([]) == Decimal(0)
+
+    def test_service_item_is_immutable(self):
+        """Test that service item fields cannot be reassigned."""
+        item = IncomeServiceItem(
+            name="Test Service", amount=Decimal("100"), quantity=Decimal("1")
+        )
+
+        with pytest.raises(ValidationError):
+            item.amount = Decimal("200")
+
+    def test_service_item_rejects_unknown_fields(self):
+        """Test that unknown fields are rejected."""
+        with pytest.raises(ValidationError):
+            IncomeServiceItem(
+                name="Service", amount=Decimal("100"), quantity=Decimal("1"), price=1
+            )
+
+    def test_service_item_model_construct(self):
+        """Test trusted fast path without validation."""
+        item = IncomeServiceItem.model_construct(
+            name="Test Service", amount=Decimal("100.50"), quantity=Decimal("2")
+        )
+
+        assert item.get_total_amount() == Decimal("201.00")
+        assert item.model_dump() == {
+            "name": "Test Service",
+            "amount": "100.50",
+            "quantity": "2",
+        }
+
 
 class TestIncomeClient:
     """Test IncomeClient DTO validation and serialization."""
@@ -425,3 +503,37 @@ class TestIncomeClient:
         """Test INN validation for non-numeric input."""
         with pytest.raises(ValueError, match="INN must contain only numbers"):
             IncomeClient(inn="12345abcde")
+
+
+class TestRequestSerialization:
+    """Test direct JSON serialization of request DTOs."""
+
+    def test_income_request_json_matches_dict(self):
+        """Test that model_dump_json(by_alias=True) matches model_dump()."""
+        request = IncomeRequest(
+            services=[
+                IncomeServiceItem(
+                    name="Service", amount=Decimal("100.50"), quantity=Decimal("2")
+                )
+            ],
+            total_amount="201.00",
+            client=IncomeClient(
+                display_name="LLC Company",
+                income_type=IncomeType.FROM_LEGAL_ENTITY,
+                inn="1234567890",
+            ),
+        )
+
+        assert json.loads(request.model_dump_json(by_alias=True)) == (
+            request.model_dump()
+        )
+
+    def test_cancel_request_json_matches_dict(self):
+        """Test that model_dump_json(by_alias=True) matches model_dump()."""
+        request = CancelRequest(
+            comment=CancelCommentType.REFUND, receipt_uuid="test-uuid"
+        )
+
+        assert json.loads(request.model_dump_json(by_alias=True)) == (
+            request.model_dump()
+        )